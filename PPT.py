@@ -1,19 +1,27 @@
 import streamlit as st
 import requests
-from PIL import Image
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PIL import Image, ImageDraw
 import io
 import base64
-from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
 import openai
 import google.generativeai as genai
+import functools
+import gc
 import json
-import os
-from datetime import datetime
+import random
+import re
+import shutil
+import threading
+import time
 import docx
-import pandas as pd
+
+try:
+    # Optional SIMD-accelerated JSON parser; stdlib json is the fallback
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 # Page configuration
 st.set_page_config(
@@ -23,6 +31,369 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+@st.cache_resource
+def _get_http_session():
+    """Shared requests.Session so HTTPS connections (search, DALL-E,
+    Stability, image CDN) are kept alive across calls and reruns"""
+    session = requests.Session()
+    # Size the pool for the image thread-pool fanout so concurrent workers
+    # reuse pooled connections instead of discarding them
+    adapter = requests.adapters.HTTPAdapter(pool_connections=8, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+@st.cache_resource
+def _get_vision_model():
+    """Construct the Gemini Vision model once per server process instead of
+    per analysis call"""
+    return genai.GenerativeModel('gemini-pro-vision')
+
+@functools.lru_cache(maxsize=1)
+def _default_font():
+    """Load PIL's default bitmap font once instead of per placeholder"""
+    from PIL import ImageFont
+    return ImageFont.load_default()
+
+@functools.lru_cache(maxsize=1)
+def _date_stamp(day_ordinal):
+    """Date tag for download filenames; keyed by ordinal so the cache rolls
+    over at midnight, and formatted without the strftime locale machinery"""
+    from datetime import date
+    d = date.fromordinal(day_ordinal)
+    return f"{d.year:04d}{d.month:02d}{d.day:02d}"
+
+_MONTH_NAMES = ("January", "February", "March", "April", "May", "June", "July",
+                "August", "September", "October", "November", "December")
+
+@functools.lru_cache(maxsize=1)
+def _display_date(day_ordinal):
+    """Human-readable date for the title slide; cached per day so repeated
+    decks reuse the string rather than re-running strftime"""
+    from datetime import date
+    d = date.fromordinal(day_ordinal)
+    return f"{_MONTH_NAMES[d.month - 1]} {d.day}, {d.year}"
+
+@functools.lru_cache(maxsize=1)
+def _default_pptx_bytes():
+    """Serialize python-pptx's default template once; Presentation() re-parses
+    the packaged template zip on every call otherwise"""
+    from pptx import Presentation
+    buf = io.BytesIO()
+    Presentation().save(buf)
+    return buf.getvalue()
+
+# Colors for each presentation style, stored as packed 0xRRGGBB ints;
+# RGBColor objects are only materialized at the pptx-writing boundary
+_THEME_COLORS = {
+    "Professional": {"title": 0x1F4E79, "content": 0x404040},
+    "Creative": {"title": 0xC00000, "content": 0x404040},
+    "Academic": {"title": 0x006666, "content": 0x333333},
+    "Minimal": {"title": 0x000000, "content": 0x595959}
+}
+
+# The same colors pre-rendered as the hex strings DrawingML wants, so the
+# deck builder never re-formats them
+_THEME_HEX = {
+    name: {role: f"{value:06X}" for role, value in colors.items()}
+    for name, colors in _THEME_COLORS.items()
+}
+
+# Example topics offered in the UI; a single selectbox over this tuple is
+# far cheaper per rerun than one button widget per example
+EXAMPLE_TOPICS = (
+    "Climate Change Solutions",
+    "Artificial Intelligence in Healthcare",
+    "Renewable Energy Trends",
+    "Digital Marketing Strategies",
+    "Remote Work Best Practices",
+    "Cybersecurity Fundamentals",
+    "Space Exploration Milestones",
+    "Sustainable Business Practices"
+)
+
+# Precompiled patterns for turning a topic into a safe download filename
+_FN_STRIP = re.compile(r'[^\w\s-]')
+_FN_SPACE = re.compile(r'[-\s]+')
+
+# Models often wrap the requested JSON in a markdown code fence
+_JSON_FENCE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
+# Splits a numbered multi-image analysis answer into per-image parts
+_NUMBERED_SPLIT = re.compile(r'\n\s*\d+[.)]\s*')
+
+# Non-empty runs between periods, scanned lazily so long uploads never
+# materialize a full sentence list
+_SENTENCE = re.compile(r'[^.]+')
+
+def _extract_key_points(text, limit=4):
+    """Pull the first few substantial sentences out of uploaded content so
+    they can seed the slide bullets"""
+    points = []
+    for match in _SENTENCE.finditer(text):
+        sentence = match.group().strip()
+        if len(sentence) > 10:
+            points.append(sentence)
+            if len(points) == limit:
+                break
+    return points
+
+def _outer_object(text):
+    """Return the first balanced top-level {...} in text, found in one
+    forward pass, or None if there isn't one"""
+    start = text.find('{')
+    if start < 0:
+        return None
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if escaped:
+            escaped = False
+        elif ch == '\\':
+            escaped = True
+        elif ch == '"':
+            in_string = not in_string
+        elif not in_string:
+            if ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+    return None
+
+def _parse_slides_json(text):
+    """Parse the model's JSON reply, salvaging fenced or surrounded output
+    instead of discarding the whole response on a decode error"""
+    try:
+        return _json_loads(text)
+    except ValueError:
+        match = _JSON_FENCE.search(text)
+        if match:
+            return _json_loads(match.group(1))
+        # No fence: the model may have wrapped the JSON in prose, so pull
+        # out the outermost balanced object before giving up
+        candidate = _outer_object(text)
+        if candidate:
+            return _json_loads(candidate)
+        raise
+
+# Success banner template, bound once so the handler only joins the labels
+_SUCCESS_TMPL = "Your presentation has been generated successfully! Features used: {feats}".format
+
+# Invariant part of the content-generation prompt, built once at import time;
+# only the topic and research context vary per call
+_CONTENT_PROMPT = """
+Create a professional PowerPoint presentation about: {topic}
+
+Research context: {research_context}
+
+Generate 8-10 slides with the following structure:
+1. Title slide
+2. Overview/Agenda
+3. 5-7 content slides
+4. Conclusion
+5. Q&A slide
+
+For each slide, provide:
+- Slide title
+- 3-5 bullet points (concise)
+- Speaker notes (detailed explanation)
+- Image prompt (description for AI image generation)
+
+Format as JSON:
+{{
+    "slides": [
+        {{
+            "title": "Slide Title",
+            "bullets": ["Point 1", "Point 2", "Point 3"],
+            "speaker_notes": "Detailed explanation...",
+            "image_prompt": "Description for image generation"
+        }}
+    ]
+}}
+"""
+
+# Fallback slide templates, built once at import time. Only the selected
+# entries are formatted with the actual topic when basic content is generated.
+_BASIC_SLIDE_TEMPLATES = (
+    {
+        "title": "{topic}",
+        "bullets": ("Welcome", "Overview of today's presentation", "Key objectives"),
+        "speaker_notes": "Welcome everyone to this presentation about {topic}. Today we'll cover the key aspects and insights.",
+        "image_prompt": "Professional title slide background for {topic}"
+    },
+    {
+        "title": "Agenda",
+        "bullets": ("Introduction", "Main Topics", "Key Findings", "Conclusion"),
+        "speaker_notes": "Here's what we'll cover in today's presentation.",
+        "image_prompt": "Clean agenda or roadmap visual"
+    },
+    {
+        "title": "Introduction to {topic}",
+        "bullets": ("Key concept 1", "Key concept 2", "Key concept 3"),
+        "speaker_notes": "Let's start with an introduction to {topic}.",
+        "image_prompt": "Introductory image related to {topic}"
+    },
+    {
+        "title": "Key Points",
+        "bullets": ("Important point 1", "Important point 2", "Important point 3"),
+        "speaker_notes": "These are the key points we need to understand.",
+        "image_prompt": "Visual representation of key concepts in {topic}"
+    },
+    {
+        "title": "Conclusion",
+        "bullets": ("Summary of key points", "Next steps", "Thank you"),
+        "speaker_notes": "To conclude, let's summarize what we've learned today.",
+        "image_prompt": "Professional conclusion slide background"
+    }
+)
+
+class _RateLimiter:
+    """Client-side pacing for one provider's API calls. Spacing between
+    calls shrinks additively while the provider accepts them and doubles
+    when it pushes back, so sustained use settles just under the allowed
+    rate instead of burning round-trips on 429 retry storms"""
+
+    def __init__(self, max_interval=30.0, cooldown=60.0):
+        self._lock = threading.Lock()
+        self._interval = 0.0
+        self._next_at = 0.0
+        self._max_interval = max_interval
+        self._cooldown = cooldown
+        self._last_throttle = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            # A provider that has stopped pushing back earns its rate
+            # again: halve the spacing for each cooldown period since the
+            # last 429, so one burst doesn't pin the process at the cap
+            while self._interval > 0.0 and now - self._last_throttle >= self._cooldown:
+                self._interval = self._interval / 2 if self._interval >= 0.1 else 0.0
+                self._last_throttle += self._cooldown
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._interval
+        if wait > 0:
+            time.sleep(wait)
+
+    def success(self):
+        with self._lock:
+            self._interval = max(0.0, self._interval - 0.05)
+
+    def throttled(self):
+        with self._lock:
+            self._interval = min(self._max_interval, max(0.5, self._interval * 2))
+            self._last_throttle = time.monotonic()
+
+class _CircuitBreaker:
+    """Skip calls to an upstream for a cooldown window after repeated
+    consecutive failures, so one hung or erroring provider degrades to the
+    fallback path instead of stalling every generation"""
+
+    def __init__(self, threshold=3, cooldown=60.0):
+        self._lock = threading.Lock()
+        self._threshold = threshold
+        self._cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0.0
+
+    def is_open(self):
+        with self._lock:
+            return time.monotonic() < self._open_until
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self._threshold:
+                self._failures = 0
+                self._open_until = time.monotonic() + self._cooldown
+
+_SEARCH_BREAKER = _CircuitBreaker()
+
+# One limiter per upstream provider; worker threads share them
+_PROVIDER_LIMITERS = {
+    "openai": _RateLimiter(),
+    "gemini": _RateLimiter(),
+    "stability": _RateLimiter(),
+}
+
+def _is_rate_limited(exc):
+    """Best-effort 429 detection across the SDKs in play, none of which
+    share an exception hierarchy"""
+    msg = str(exc).lower()
+    return "429" in msg or "rate limit" in msg or "too many requests" in msg
+
+def _call_with_retry(fn, attempts=3, base=0.5, limiter=None):
+    """Call fn, retrying transient API failures (rate limits, flaky network)
+    with exponential backoff plus jitter before giving up; when a limiter is
+    given, calls are paced through it and 429s slow it down"""
+    for attempt in range(attempts):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            result = fn()
+        except Exception as exc:
+            if limiter is not None and _is_rate_limited(exc):
+                limiter.throttled()
+            if attempt == attempts - 1:
+                raise
+            time.sleep(base * (2 ** attempt) + random.uniform(0, 0.25))
+        else:
+            if limiter is not None:
+                limiter.success()
+            return result
+
+def _encode_slide_image(img):
+    """Encode a PIL image for slide embedding: JPEG for photographic
+    RGB/grayscale output, PNG for paletted or alpha images where it is
+    both smaller and lossless"""
+    stream = io.BytesIO()
+    if img.mode in ('RGB', 'L'):
+        img.save(stream, format='JPEG', quality=85, optimize=True)
+    else:
+        img.save(stream, format='PNG', optimize=True)
+    return stream.getvalue()
+
+def _normalize_slide(raw):
+    """Coerce one parsed slide into the fixed schema the deck builder
+    expects, so malformed AI output can't KeyError mid-build"""
+    return {
+        "title": str(raw.get("title", "Untitled")),
+        "bullets": [str(b) for b in raw.get("bullets", ())],
+        "speaker_notes": str(raw.get("speaker_notes", "")),
+        "image_prompt": str(raw.get("image_prompt", ""))
+    }
+
+def _fill_topic(template, topic):
+    """Interpolate the topic only when the template actually references it,
+    so constant strings skip the format machinery entirely"""
+    return template.format(topic=topic) if "{topic}" in template else template
+
+@functools.lru_cache(maxsize=128)
+def _basic_slide(topic, index):
+    """Format one fallback slide for a topic; pure in (topic, index), so
+    repeated topics reuse the already-formatted dict"""
+    template = _BASIC_SLIDE_TEMPLATES[index]
+    if any("{topic}" in b for b in template["bullets"]):
+        bullets = [_fill_topic(b, topic) for b in template["bullets"]]
+    else:
+        # All bullets are constants: share the template tuple itself
+        # instead of allocating a fresh list per call
+        bullets = template["bullets"]
+    return {
+        "title": _fill_topic(template["title"], topic),
+        "bullets": bullets,
+        "speaker_notes": _fill_topic(template["speaker_notes"], topic),
+        "image_prompt": _fill_topic(template["image_prompt"], topic)
+    }
+
 # Custom CSS for better styling
 st.markdown("""
 <style>
@@ -57,277 +428,371 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 class PowerPointGenerator:
-    def __init__(self):
-        self.presentation = Presentation()
-        self.slides_content = []
-        
     def setup_apis(self):
         """Setup API keys from Streamlit secrets or user input"""
         st.sidebar.header("🔑 API Configuration")
         
+        # Keyed widgets persist the entered keys in session state across
+        # reruns instead of falling back to secrets each time
         # OpenAI API Key (for content generation and images)
         openai_key = st.sidebar.text_input(
-            "OpenAI API Key", 
+            "OpenAI API Key",
             type="password",
-            value=st.secrets.get("OPENAI_API_KEY", "")
+            value=st.secrets.get("OPENAI_API_KEY", ""),
+            key="openai_api_key"
         )
-        
+
         # Google AI API Key (for Gemini)
         google_key = st.sidebar.text_input(
-            "Google AI API Key (Optional)", 
+            "Google AI API Key (Optional)",
             type="password",
-            value=st.secrets.get("GOOGLE_API_KEY", "")
+            value=st.secrets.get("GOOGLE_API_KEY", ""),
+            key="google_api_key"
         )
-        
+
         # Stability AI API Key (for image generation)
         stability_key = st.sidebar.text_input(
-            "Stability AI API Key (Optional)", 
+            "Stability AI API Key (Optional)",
             type="password",
-            value=st.secrets.get("STABILITY_API_KEY", "")
+            value=st.secrets.get("STABILITY_API_KEY", ""),
+            key="stability_api_key"
         )
-        
+
         if openai_key:
             openai.api_key = openai_key
-        if google_key:
+        # Reconfiguring the Gemini SDK is only needed when the key changes,
+        # not on every rerun
+        if google_key and st.session_state.get("_configured_google_key") != google_key:
             genai.configure(api_key=google_key)
-        
+            st.session_state._configured_google_key = google_key
+
         return openai_key, google_key, stability_key
     
     def search_web(self, query):
-        """Search web for information using SerpAPI or similar"""
+        """Search web for information using SerpAPI or similar; the query is
+        normalized so trivially different phrasings share a cache entry, and
+        a circuit breaker skips the upstream while it is misbehaving"""
+        if _SEARCH_BREAKER.is_open():
+            return []
         try:
-            # Using a free alternative - you can replace with SerpAPI
-            search_url = f"https://api.duckduckgo.com/search"
-            params = {
-                'q': query,
-                'format': 'json',
-                'no_html': '1',
-                'skip_disambig': '1'
-            }
-            
-            response = requests.get(search_url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                results = []
-                for result in data.get('RelatedTopics', [])[:5]:
-                    if 'Text' in result:
-                        results.append(result['Text'])
-                return results
+            results = _cached_search(' '.join(query.lower().split()))
         except Exception as e:
+            _SEARCH_BREAKER.record_failure()
             st.warning(f"Web search failed: {str(e)}")
             return []
-        return []
+        _SEARCH_BREAKER.record_success()
+        return results
     
     def analyze_image(self, image, google_key):
         """Analyze uploaded image using Google Gemini Vision"""
         try:
             if not google_key:
                 return "Image analysis requires Google AI API key"
-            
-            model = genai.GenerativeModel('gemini-pro-vision')
-            response = model.generate_content([
+
+            model = _get_vision_model()
+            response = _call_with_retry(lambda: model.generate_content([
                 "Describe this image in detail, including any text, objects, people, or relevant information that could be used in a presentation:",
                 image
-            ])
+            ]), limiter=_PROVIDER_LIMITERS["gemini"])
             return response.text
         except Exception as e:
             return f"Image analysis failed: {str(e)}"
-    
-    def generate_ai_image(self, prompt, api_key, provider="openai"):
-        """Generate AI images using OpenAI DALL-E or Stability AI"""
+
+    def analyze_images(self, images, google_key):
+        """Analyze all uploaded images in one Gemini Vision request instead
+        of one blocking call per image"""
+        if not google_key:
+            return ["Image analysis requires Google AI API key"] * len(images)
+        if len(images) == 1:
+            return [self.analyze_image(images[0], google_key)]
+
         try:
-            if provider == "openai" and api_key:
-                response = openai.Image.create(
-                    prompt=f"Professional presentation slide image: {prompt}",
-                    n=1,
-                    size="1024x1024"
-                )
-                
-                image_url = response['data'][0]['url']
-                image_response = requests.get(image_url)
-                
-                if image_response.status_code == 200:
-                    img = Image.open(io.BytesIO(image_response.content))
-                    return img
-                    
-            elif provider == "stability" and api_key:
-                # Stability AI implementation
-                url = "https://api.stability.ai/v1/generation/stable-diffusion-xl-1024-v1-0/text-to-image"
-                
-                body = {
-                    "steps": 40,
-                    "width": 1024,
-                    "height": 1024,
-                    "seed": 0,
-                    "cfg_scale": 5,
-                    "samples": 1,
-                    "text_prompts": [
-                        {
-                            "text": f"Professional presentation slide image: {prompt}",
-                            "weight": 1
-                        }
-                    ],
-                }
-                
-                headers = {
-                    "Accept": "application/json",
-                    "Content-Type": "application/json",
-                    "Authorization": f"Bearer {api_key}",
-                }
-                
-                response = requests.post(url, headers=headers, json=body)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    image_data = base64.b64decode(data["artifacts"][0]["base64"])
-                    img = Image.open(io.BytesIO(image_data))
-                    return img
-            
-            return None
-                
+            model = _get_vision_model()
+            prompt = [
+                f"For each of the {len(images)} images below, describe it in "
+                "detail, including any text, objects, people, or relevant "
+                "information that could be used in a presentation. Answer "
+                "with one numbered paragraph per image, in order:"
+            ]
+            prompt.extend(images)
+            response = _call_with_retry(lambda: model.generate_content(prompt),
+                                        limiter=_PROVIDER_LIMITERS["gemini"])
+
+            # Split the numbered answer back into per-image descriptions;
+            # fall back to the whole text for every image if that fails
+            parts = _NUMBERED_SPLIT.split("\n" + response.text)
+            parts = [p.strip() for p in parts if p.strip()]
+            if len(parts) == len(images):
+                return parts
+            return [response.text] * len(images)
         except Exception as e:
-            st.warning(f"Image generation failed: {str(e)}")
-            return None
+            return [f"Image analysis failed: {str(e)}"] * len(images)
     
-    def generate_presentation_content(self, topic, research_data, openai_key):
-        """Generate presentation content using OpenAI GPT"""
-        try:
-            if not openai_key:
-                return self.generate_basic_content(topic, research_data)
-            
-            # Prepare research context
-            research_context = "\n".join(research_data) if research_data else ""
-            
-            prompt = f"""
-            Create a professional PowerPoint presentation about: {topic}
-            
-            Research context: {research_context}
-            
-            Generate 8-10 slides with the following structure:
-            1. Title slide
-            2. Overview/Agenda
-            3. 5-7 content slides
-            4. Conclusion
-            5. Q&A slide
-            
-            For each slide, provide:
-            - Slide title
-            - 3-5 bullet points (concise)
-            - Speaker notes (detailed explanation)
-            - Image prompt (description for AI image generation)
-            
-            Format as JSON:
-            {{
-                "slides": [
-                    {{
-                        "title": "Slide Title",
-                        "bullets": ["Point 1", "Point 2", "Point 3"],
-                        "speaker_notes": "Detailed explanation...",
-                        "image_prompt": "Description for image generation"
-                    }}
-                ]
-            }}
-            """
-            
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000,
-                temperature=0.7
+    def generate_ai_image(self, prompt, api_key, provider="openai"):
+        """Generate AI images using OpenAI DALL-E or Stability AI.
+
+        Failures raise: this runs on worker threads, where st.* calls are
+        silently dropped, so errors must travel back to the main thread
+        in the result rather than be reported here"""
+        if provider == "openai" and api_key:
+            # The picture is rendered at ~4"x3" on the slide, so 512px is
+            # plenty; the 1024 tier costs more and transfers 4x the bytes
+            response = _call_with_retry(lambda: openai.Image.create(
+                prompt=f"Professional presentation slide image: {prompt}",
+                n=1,
+                size="512x512"
+            ), limiter=_PROVIDER_LIMITERS["openai"])
+
+            image_url = response['data'][0]['url']
+
+            # Stream the CDN download straight into a buffer instead of
+            # materializing response.content as a second full copy
+            with _get_http_session().get(image_url, stream=True, timeout=30) as image_response:
+                image_response.raise_for_status()
+                buf = io.BytesIO()
+                shutil.copyfileobj(image_response.raw, buf, length=64 * 1024)
+                buf.seek(0)
+                img = Image.open(buf)
+                # Downscale to the slide footprint before embedding
+                img.thumbnail((480, 360), Image.Resampling.LANCZOS)
+                return img
+
+        elif provider == "stability" and api_key:
+            # Stability AI implementation
+            url = "https://api.stability.ai/v1/generation/stable-diffusion-xl-1024-v1-0/text-to-image"
+
+            body = {
+                "steps": 40,
+                "width": 1024,
+                "height": 1024,
+                "seed": 0,
+                "cfg_scale": 5,
+                "samples": 1,
+                "text_prompts": [
+                    {
+                        "text": f"Professional presentation slide image: {prompt}",
+                        "weight": 1
+                    }
+                ],
+            }
+
+            headers = {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "Authorization": f"Bearer {api_key}",
+            }
+
+            # raise_for_status inside the retried callable so HTTP
+            # errors (429 included) actually trigger backoff and
+            # limiter throttling instead of counting as successes
+            def _post():
+                resp = _get_http_session().post(url, headers=headers, json=body, timeout=60)
+                resp.raise_for_status()
+                return resp
+
+            response = _call_with_retry(
+                _post, limiter=_PROVIDER_LIMITERS["stability"]
             )
-            
-            content = json.loads(response.choices[0].message.content)
-            return content["slides"]
-            
-        except Exception as e:
-            st.warning(f"Content generation failed: {str(e)}")
+
+            data = response.json()
+            image_data = base64.b64decode(data["artifacts"][0]["base64"])
+            img = Image.open(io.BytesIO(image_data))
+            return img
+
+        return None
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _placeholder_base():
+        """Build the shared gradient backdrop once; every placeholder starts
+        from a copy of this image, so only the text overlay and PNG encode
+        vary per prompt"""
+        import numpy as np  # deferred: only needed the first time a placeholder is drawn
+
+        width, height = 1024, 768
+        shades = 235 - (60 * np.arange(height, dtype=np.uint32)) // height
+        rows = np.empty((height, width, 3), dtype=np.uint8)
+        rows[..., 0] = shades[:, None]
+        rows[..., 1] = shades[:, None]
+        rows[..., 2] = 255
+        return Image.fromarray(rows, 'RGB')
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _generate_placeholder_image(prompt_key):
+        """Render a simple gradient placeholder PNG for slides whose AI image
+        is unavailable; memoized because placeholders differ only by the
+        prompt excerpt drawn on them, and the PNG encode dominates the cost"""
+        img = PowerPointGenerator._placeholder_base().copy()
+        height = img.height
+        draw = ImageDraw.Draw(img)
+        draw.text((40, height // 2), prompt_key, fill=(40, 40, 90), font=_default_font())
+
+        # A handful of palette entries is plenty for a gradient backdrop and
+        # shrinks the embedded PNG roughly an order of magnitude
+        img = img.convert('P', palette=Image.ADAPTIVE, colors=8)
+
+        buf = io.BytesIO()
+        img.save(buf, format='PNG', optimize=True)
+        return buf.getvalue()
+
+    def generate_presentation_content(self, topic, research_data, openai_key):
+        """Generate presentation content using OpenAI GPT. API failures
+        propagate so the cached wrapper doesn't memoize fallback content;
+        the caller degrades to generate_basic_content instead"""
+        if not openai_key:
             return self.generate_basic_content(topic, research_data)
+
+        # Prepare research context
+        research_context = "\n".join(research_data) if research_data else ""
+
+        prompt = _CONTENT_PROMPT.format(topic=topic, research_context=research_context)
+
+        response = _call_with_retry(lambda: openai.ChatCompletion.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=2000,
+            temperature=0.7
+        ), limiter=_PROVIDER_LIMITERS["openai"])
+
+        content = _parse_slides_json(response.choices[0].message.content)
+        return [_normalize_slide(s) for s in content["slides"]]
     
     def generate_basic_content(self, topic, research_data):
         """Generate basic content when AI is not available"""
-        slides = [
-            {
-                "title": f"{topic}",
-                "bullets": ["Welcome", "Overview of today's presentation", "Key objectives"],
-                "speaker_notes": f"Welcome everyone to this presentation about {topic}. Today we'll cover the key aspects and insights.",
-                "image_prompt": f"Professional title slide background for {topic}"
-            },
-            {
-                "title": "Agenda",
-                "bullets": ["Introduction", "Main Topics", "Key Findings", "Conclusion"],
-                "speaker_notes": "Here's what we'll cover in today's presentation.",
-                "image_prompt": "Clean agenda or roadmap visual"
-            },
-            {
-                "title": f"Introduction to {topic}",
-                "bullets": research_data[:3] if research_data else ["Key concept 1", "Key concept 2", "Key concept 3"],
-                "speaker_notes": f"Let's start with an introduction to {topic}.",
-                "image_prompt": f"Introductory image related to {topic}"
-            },
-            {
-                "title": "Key Points",
-                "bullets": research_data[3:6] if len(research_data) > 3 else ["Important point 1", "Important point 2", "Important point 3"],
-                "speaker_notes": "These are the key points we need to understand.",
-                "image_prompt": f"Visual representation of key concepts in {topic}"
-            },
-            {
-                "title": "Conclusion",
-                "bullets": ["Summary of key points", "Next steps", "Thank you"],
-                "speaker_notes": "To conclude, let's summarize what we've learned today.",
-                "image_prompt": "Professional conclusion slide background"
-            }
-        ]
+        slides = []
+        for i in range(len(_BASIC_SLIDE_TEMPLATES)):
+            # Shallow-copy so research overrides don't touch the cached dict
+            slide = dict(_basic_slide(topic, i))
+            # Prefer research snippets over the placeholder bullets on the
+            # introduction (index 2) and key-points (index 3) slides
+            if i == 2 and research_data:
+                slide["bullets"] = research_data[:3]
+            elif i == 3 and len(research_data) > 3:
+                slide["bullets"] = research_data[3:6]
+            slides.append(slide)
         return slides
     
-    def create_powerpoint(self, slides_content, generated_images=None):
+    def create_powerpoint(self, slides_content, generated_images=None, style="Professional"):
         """Create PowerPoint presentation"""
-        prs = Presentation()
-        
-        for i, slide_data in enumerate(slides_content):
-            # Create slide
-            if i == 0:  # Title slide
-                slide_layout = prs.slide_layouts[0]
+        # Imported here so the app doesn't pay python-pptx's import cost
+        # on reruns that never build a presentation
+        from pptx import Presentation
+        from pptx.util import Inches
+        from pptx.oxml.ns import qn
+        from lxml import etree
+        from datetime import date
+
+        prs = Presentation(io.BytesIO(_default_pptx_bytes()))
+
+        # Set the style's title color once on the slide master; every title
+        # inherits it, so no per-slide inline color overrides are written
+        theme = _THEME_HEX.get(style, _THEME_HEX["Professional"])
+        defRPr = prs.slide_master.element.find(
+            './/' + qn('p:titleStyle') + '/' + qn('a:lvl1pPr') + '/' + qn('a:defRPr')
+        )
+        if defRPr is not None:
+            fill = defRPr.find(qn('a:solidFill'))
+            if fill is None:
+                fill = etree.SubElement(defRPr, qn('a:solidFill'))
             else:
-                slide_layout = prs.slide_layouts[1]
-            
-            slide = prs.slides.add_slide(slide_layout)
-            
+                for child in list(fill):
+                    fill.remove(child)
+            srgb = etree.SubElement(fill, qn('a:srgbClr'))
+            srgb.set('val', theme['title'])
+
+        # Picture geometry is identical on every slide; compute the EMU
+        # values once instead of per image
+        img_left, img_top = Inches(6), Inches(1)
+        img_width, img_height = Inches(3), Inches(3)
+
+        # Prepare/emit split: encode the slide images in a thread pool up
+        # front (the encoders release the GIL), so the single-threaded
+        # python-pptx loop below only attaches ready-made streams
+        image_streams = [None] * len(slides_content)
+        if generated_images:
+            def _encode(img):
+                if img is None:
+                    return None
+                # Pre-encoded bytes (the cached path) pass straight
+                # through without a decode/re-encode cycle
+                if isinstance(img, bytes):
+                    return io.BytesIO(img)
+                return io.BytesIO(_encode_slide_image(img))
+
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                image_streams = list(pool.map(_encode, generated_images))
+
+        # Specialize the per-slide builder once per deck: layouts, picture
+        # geometry, and qualified XML tags are captured as closure locals so
+        # the loop below does no repeated lookups
+        title_layout = prs.slide_layouts[0]
+        content_layout = prs.slide_layouts[1]
+        p_tag, r_tag, t_tag = qn('a:p'), qn('a:r'), qn('a:t')
+        sub_element = etree.SubElement
+        deck_date = _display_date(date.today().toordinal())
+
+        def build_slide(i, slide_data):
+            layout = title_layout if i == 0 else content_layout
+            slide = prs.slides.add_slide(layout)
+
             # Add title
             title = slide.shapes.title
             title.text = slide_data["title"]
-            
+
             # Add content
-            if slide_layout == prs.slide_layouts[1]:  # Content slide
+            if layout is content_layout:
                 content = slide.placeholders[1]
                 tf = content.text_frame
                 tf.text = slide_data["bullets"][0] if slide_data["bullets"] else ""
-                
+
+                # Build the remaining <a:p> elements with lxml in one pass;
+                # add_paragraph() pays an XPath insert per bullet
+                txBody = tf._txBody
                 for bullet in slide_data["bullets"][1:]:
-                    p = tf.add_paragraph()
-                    p.text = bullet
-                    p.level = 0
-            
+                    p = sub_element(txBody, p_tag)
+                    r = sub_element(p, r_tag)
+                    t = sub_element(r, t_tag)
+                    t.text = bullet
+            else:
+                # Title slide: stamp the generation date into the subtitle
+                slide.placeholders[1].text = deck_date
+
             # Add image if available
-            if generated_images and i < len(generated_images) and generated_images[i]:
+            if i < len(image_streams) and image_streams[i] is not None:
                 try:
-                    img_stream = io.BytesIO()
-                    generated_images[i].save(img_stream, format='PNG')
-                    img_stream.seek(0)
-                    
                     slide.shapes.add_picture(
-                        img_stream, 
-                        Inches(6), Inches(1), 
-                        Inches(3), Inches(3)
+                        image_streams[i],
+                        img_left, img_top,
+                        img_width, img_height
                     )
                 except Exception as e:
                     st.warning(f"Failed to add image to slide {i+1}: {str(e)}")
-            
+
             # Add speaker notes
             notes_slide = slide.notes_slide
             text_frame = notes_slide.notes_text_frame
             text_frame.text = slide_data["speaker_notes"]
-        
-        return prs
+
+        # The slide loop churns through thousands of short-lived lxml proxy
+        # objects; pausing the cyclic collector keeps it from firing
+        # mid-build, with one sweep afterwards
+        gc.disable()
+        try:
+            for i, slide_data in enumerate(slides_content):
+                build_slide(i, slide_data)
+        finally:
+            gc.enable()
+            gc.collect()
+
+        # Serialize once into a BytesIO and hand the buffer to the caller;
+        # st.download_button reads it directly (it rejects other file-like
+        # types such as SpooledTemporaryFile), so the deck bytes are never
+        # duplicated in user code
+        ppt_buf = io.BytesIO()
+        prs.save(ppt_buf)
+        ppt_buf.seek(0)
+        return ppt_buf
     
     def read_uploaded_file(self, uploaded_file):
         """Read content from uploaded files"""
@@ -335,12 +800,20 @@ class PowerPointGenerator:
         
         try:
             if uploaded_file.type == "text/plain":
-                content = str(uploaded_file.read(), "utf-8")
-            
+                content = uploaded_file.read().decode("utf-8", errors="replace")
+
             elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+                # Walk the body XML directly: skips python-docx's Paragraph
+                # proxy objects and the quadratic string concatenation
+                from docx.oxml.ns import qn as docx_qn
                 doc = docx.Document(uploaded_file)
-                for paragraph in doc.paragraphs:
-                    content += paragraph.text + "\n"
+                p_tag, t_tag = docx_qn('w:p'), docx_qn('w:t')
+                parts = [
+                    ''.join(t.text or '' for t in p.iter(t_tag))
+                    for p in doc.element.body.iter(p_tag)
+                ]
+                parts.append('')  # keep the historical trailing newline
+                content = '\n'.join(parts)
             
             elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.presentationml.presentation":
                 # Basic PPTX reading - you might need python-pptx
@@ -351,10 +824,61 @@ class PowerPointGenerator:
             
         return content
 
+@st.cache_resource
+def _get_generator():
+    """Reuse a single PowerPointGenerator across Streamlit reruns"""
+    return PowerPointGenerator()
+
+@st.cache_data(ttl=600, max_entries=256, show_spinner=False)
+def _cached_search(query):
+    """Fetch DuckDuckGo snippets for a normalized query; memoized for ten
+    minutes so re-generating around the same topic skips the round-trip.
+    Failures raise so they are not cached as empty results"""
+    # Using a free alternative - you can replace with SerpAPI
+    search_url = "https://api.duckduckgo.com/search"
+    params = {
+        'q': query,
+        'format': 'json',
+        'no_html': '1',
+        'skip_disambig': '1'
+    }
+    # Separate connect/read timeouts: fail fast when the host is
+    # unreachable, allow a few seconds for the response body
+    response = _get_http_session().get(search_url, params=params, timeout=(2, 5))
+    response.raise_for_status()
+    data = response.json()
+    return [
+        result['Text']
+        for result in data.get('RelatedTopics', [])[:5]
+        if 'Text' in result
+    ]
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _cached_slide_image(prompt, provider, _api_key):
+    """Cache generated slide images, already encoded for embedding, by
+    (prompt, provider) so regenerating a deck reuses pixels instead of
+    re-billing the API; the underscore keeps the key itself out of the
+    cache key. Failures raise so a transient API error isn't cached as
+    a placeholder for the full ttl"""
+    img = _get_generator().generate_ai_image(prompt, _api_key, provider)
+    if img is None:
+        raise RuntimeError(f"No image produced for prompt: {prompt[:50]}")
+    return _encode_slide_image(img)
+
+@st.cache_data(show_spinner=False)
+def _cached_slides_content(topic, research_data, openai_key):
+    """Memoize slide content so re-clicking Generate with the same inputs
+    doesn't redo the AI call; research_data must be a tuple for hashability.
+    API failures raise through so they are never cached — the next click
+    retries instead of being pinned to stale fallback content"""
+    return _get_generator().generate_presentation_content(
+        topic, list(research_data), openai_key
+    )
+
 def main():
     st.markdown('<h1 class="main-header">🎯 AI PowerPoint Generator</h1>', unsafe_allow_html=True)
-    
-    generator = PowerPointGenerator()
+
+    generator = _get_generator()
     
     # Setup APIs
     openai_key, google_key, stability_key = generator.setup_apis()
@@ -371,15 +895,18 @@ def main():
             ["Text Input", "File Upload", "Topic Only"]
         )
         
+        example = st.selectbox("Try an example topic:", ("—",) + EXAMPLE_TOPICS)
+        default_topic = "" if example == "—" else example
+
         topic = ""
         uploaded_content = ""
-        
+
         if input_method == "Text Input":
-            topic = st.text_input("Presentation Topic:", placeholder="e.g., Climate Change Solutions")
+            topic = st.text_input("Presentation Topic:", value=default_topic, placeholder="e.g., Climate Change Solutions")
             uploaded_content = st.text_area("Additional Content:", height=150, placeholder="Paste your content here...")
-        
+
         elif input_method == "File Upload":
-            topic = st.text_input("Presentation Topic:", placeholder="e.g., Climate Change Solutions")
+            topic = st.text_input("Presentation Topic:", value=default_topic, placeholder="e.g., Climate Change Solutions")
             uploaded_file = st.file_uploader(
                 "Upload file:", 
                 type=['txt', 'docx', 'pptx'],
@@ -392,7 +919,7 @@ def main():
                     st.success("File uploaded successfully!")
         
         else:  # Topic Only
-            topic = st.text_input("Presentation Topic:", placeholder="e.g., Climate Change Solutions")
+            topic = st.text_input("Presentation Topic:", value=default_topic, placeholder="e.g., Climate Change Solutions")
         
         # Image upload for analysis
         st.markdown('<div class="step-header">🖼️ Step 2: Upload Images (Optional)</div>', unsafe_allow_html=True)
@@ -404,128 +931,207 @@ def main():
         
         image_descriptions = []
         if uploaded_images and google_key:
-            for img_file in uploaded_images:
-                img = Image.open(img_file)
-                description = generator.analyze_image(img, google_key)
-                image_descriptions.append(description)
+            images = [Image.open(img_file) for img_file in uploaded_images]
+            image_descriptions = generator.analyze_images(images, google_key)
+            for img, description in zip(images, image_descriptions):
                 st.image(img, caption=f"Analysis: {description[:100]}...", width=300)
     
     with col2:
         st.markdown('<div class="info-box">ℹ️ <strong>How it works:</strong><br>1. Enter your topic or upload content<br>2. AI researches the web<br>3. Generates structured slides<br>4. Creates AI images<br>5. Builds PowerPoint file</div>', unsafe_allow_html=True)
         
-        # Presentation settings
+        # Presentation settings; batched in a form so slider drags and
+        # checkbox ticks don't each trigger a full script rerun. Generate
+        # is the form's submit button, so a run always sees the settings
+        # as they stand at click time — never pre-submit values
         st.markdown("⚙️ **Settings**")
-        num_slides = st.slider("Number of slides:", 5, 15, 8)
-        style = st.selectbox("Presentation style:", ["Professional", "Creative", "Academic", "Minimal"])
-        include_images = st.checkbox("Generate AI images", value=True)
-        
-        # Image generation provider selection
-        if include_images:
+        with st.form("settings"):
+            num_slides = st.slider("Number of slides:", 5, 15, 8)
+            style = st.selectbox("Presentation style:", list(_THEME_COLORS))
+            include_images = st.checkbox("Generate AI images", value=True)
             image_provider = st.selectbox(
                 "Image generation provider:",
                 ["openai", "stability"],
-                help="Choose between OpenAI DALL-E or Stability AI"
+                help="Choose between OpenAI DALL-E or Stability AI (used when AI images are enabled)"
             )
-        else:
-            image_provider = "openai"
-    
+            generate_clicked = st.form_submit_button("🚀 Generate Presentation", type="primary")
+
     # Generate presentation
-    if st.button("🚀 Generate Presentation", type="primary"):
+    if generate_clicked:
         if not topic:
             st.error("Please provide a topic for your presentation!")
             return
         
-        progress_bar = st.progress(0)
-        status_text = st.empty()
-        
         try:
-            # Step 1: Web research
-            status_text.text("🔍 Researching topic...")
-            progress_bar.progress(20)
-            research_data = generator.search_web(topic + " " + uploaded_content)
-            
-            # Step 2: Generate content
-            status_text.text("✍️ Generating presentation content...")
-            progress_bar.progress(40)
-            slides_content = generator.generate_presentation_content(
-                topic, research_data + image_descriptions, openai_key
-            )
-            
-            # Step 3: Generate images
-            generated_images = []
+            # Stream progress into one status container; image results are
+            # reported as they finish instead of behind a blocking bar
+            with st.status("Generating presentation...", expanded=True) as status:
+                # Step 1: Web research
+                status.write("🔍 Researching topic...")
+                research_data = generator.search_web(topic + " " + uploaded_content)
+                if uploaded_content:
+                    research_data += _extract_key_points(uploaded_content)
+
+                # Step 2: Generate content
+                status.write("✍️ Generating presentation content...")
+                content_fell_back = False
+                try:
+                    slides_content = _cached_slides_content(
+                        topic, tuple(research_data + image_descriptions), openai_key
+                    )
+                except Exception as e:
+                    content_fell_back = True
+                    # Degrade to template content without caching the
+                    # failure, so the next Generate retries the API
+                    st.warning(f"Content generation failed: {str(e)}")
+                    slides_content = generator.generate_basic_content(
+                        topic, research_data + image_descriptions
+                    )
+
+                # Step 3: Generate images
+                generated_images = []
+                image_failures = 0
+                if include_images:
+                    # Choose API key based on provider
+                    api_key = openai_key if image_provider == "openai" else stability_key
+
+                    if not api_key:
+                        status.write(f"⚠️ No {image_provider.upper()} API key provided. Using placeholder images.")
+
+                    def _image_for_prompt(prompt):
+                        # Both paths yield encoded bytes; the deck builder
+                        # and st.image consume them directly, so nothing
+                        # here pays a Pillow decode. Streamlit drops st.*
+                        # calls made off the script thread, so the error is
+                        # returned alongside the bytes for the main thread
+                        # to report
+                        data = None
+                        error = None
+                        if api_key:
+                            try:
+                                data = _cached_slide_image(prompt, image_provider, api_key)
+                            except Exception as e:
+                                # Not cached, so the next Generate retries
+                                # instead of keeping the placeholder
+                                error = str(e)
+                        if data is None:
+                            data = PowerPointGenerator._generate_placeholder_image(prompt[:50])
+                        return data, error
+
+                    # Generate once per distinct prompt (the model sometimes
+                    # repeats prompts across slides), concurrently since this
+                    # is pure network I/O, then fan back out in slide order
+                    unique_prompts = list(dict.fromkeys(s["image_prompt"] for s in slides_content))
+                    prompt_images = {}
+                    with ThreadPoolExecutor(max_workers=min(len(unique_prompts), 4)) as pool:
+                        futures = {pool.submit(_image_for_prompt, p): p for p in unique_prompts}
+                        for done, future in enumerate(as_completed(futures), 1):
+                            data, error = future.result()
+                            prompt_images[futures[future]] = data
+                            if error:
+                                image_failures += 1
+                                st.warning(f"Image generation failed: {error}")
+                            status.write(f"🎨 Image {done}/{len(unique_prompts)} ready")
+                    generated_images = [prompt_images[s["image_prompt"]] for s in slides_content]
+
+                # Step 4: Create PowerPoint
+                status.write("📊 Creating PowerPoint...")
+                ppt_bytes = generator.create_powerpoint(slides_content, generated_images, style)
+
+                status.update(label="✅ Presentation ready!", state="complete", expanded=False)
+
+            features_used = [
+                "AI content" if openai_key and not content_fell_back else "Template content"
+            ]
             if include_images:
-                status_text.text("🎨 Generating AI images...")
-                progress_bar.progress(60)
-                
-                # Choose API key based on provider
-                api_key = openai_key if image_provider == "openai" else stability_key
-                
-                if api_key:
-                    for slide in slides_content:
-                        img = generator.generate_ai_image(slide["image_prompt"], api_key, image_provider)
-                        generated_images.append(img)
+                # Label by what actually produced the images, not by what
+                # was configured: failed prompts fell back to placeholders
+                if not api_key or image_failures == len(unique_prompts):
+                    features_used.append("Placeholder images")
+                elif image_failures:
+                    features_used.append(f"{image_provider.upper()} + placeholder images")
                 else:
-                    st.warning(f"No {image_provider.upper()} API key provided. Skipping image generation.")
-            
-            # Step 4: Create PowerPoint
-            status_text.text("📊 Creating PowerPoint...")
-            progress_bar.progress(80)
-            prs = generator.create_powerpoint(slides_content, generated_images)
-            
-            # Step 5: Save and download
-            status_text.text("💾 Preparing download...")
-            progress_bar.progress(100)
-            
-            # Save to bytes
-            ppt_bytes = io.BytesIO()
-            prs.save(ppt_bytes)
-            ppt_bytes.seek(0)
-            
-            # Download button
-            st.download_button(
-                label="📥 Download PowerPoint",
-                data=ppt_bytes,
-                file_name=f"{topic.replace(' ', '_')}_presentation.pptx",
-                mime="application/vnd.openxmlformats-officedocument.presentationml.presentation"
-            )
-            
-            status_text.text("✅ Presentation ready!")
-            st.success("Your presentation has been generated successfully!")
-            
-            # Preview slides
-            st.markdown("### 👀 Preview")
-            for i, slide in enumerate(slides_content):
-                with st.expander(f"Slide {i+1}: {slide['title']}"):
-                    st.write("**Content:**")
-                    for bullet in slide['bullets']:
-                        st.write(f"• {bullet}")
-                    st.write("**Speaker Notes:**")
-                    st.write(slide['speaker_notes'])
-                    if generated_images and i < len(generated_images) and generated_images[i]:
-                        st.image(generated_images[i], width=400)
-            
+                    features_used.append(f"{image_provider.upper()} images")
+            if image_descriptions:
+                features_used.append("Image analysis")
+
+            # Stash results (with pre-rendered preview markdown) in session
+            # state so the download-button rerun doesn't discard the deck
+            # and unrelated reruns reuse the rendered preview as-is
+            st.session_state.generation = {
+                "topic": topic,
+                "slides": slides_content,
+                "images": generated_images,
+                "previews": [
+                    "\n".join(
+                        ["**Content:**"]
+                        + [f"- {bullet}" for bullet in slide['bullets']]
+                        + ["", "**Speaker Notes:**", slide['speaker_notes']]
+                    )
+                    for slide in slides_content
+                ],
+                "ppt": ppt_bytes,
+                "features": ", ".join(features_used),
+            }
+
         except Exception as e:
             st.error(f"An error occurred: {str(e)}")
-            status_text.text("❌ Generation failed")
 
-# Sidebar information
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 📋 Required APIs")
-st.sidebar.markdown("""
+    # Render results from session state: survives reruns and costs O(1)
+    # when nothing was regenerated
+    result = st.session_state.get("generation")
+    if result:
+        from datetime import date
+        result["ppt"].seek(0)
+        st.download_button(
+            label="📥 Download PowerPoint",
+            data=result["ppt"],
+            file_name=f"{_FN_SPACE.sub('_', _FN_STRIP.sub('', result['topic']))}_presentation_{_date_stamp(date.today().toordinal())}.pptx",
+            mime="application/vnd.openxmlformats-officedocument.presentationml.presentation"
+        )
+
+        st.success(_SUCCESS_TMPL(feats=result.get("features") or "Standard"))
+
+        # Preview slides
+        st.markdown("### 👀 Preview")
+        # One dataframe summarising the deck instead of a banner per slide
+        st.dataframe(
+            [
+                {
+                    "Slide": i + 1,
+                    "Title": slide["title"],
+                    "Bullets": len(slide["bullets"]),
+                    "Image": "✅" if result["images"] and i < len(result["images"]) and result["images"][i] else "—",
+                }
+                for i, slide in enumerate(result["slides"])
+            ],
+            hide_index=True,
+            use_container_width=True,
+        )
+        generated_images = result["images"]
+        for i, slide in enumerate(result["slides"]):
+            with st.expander(f"Slide {i+1}: {slide['title']}"):
+                st.markdown(result["previews"][i])
+                if generated_images and i < len(generated_images) and generated_images[i]:
+                    st.image(generated_images[i], width=400)
+
+# Static sidebar help, pre-joined so each rerun serializes one markdown
+# element instead of five
+_SIDEBAR_INFO = """---
+### 📋 Required APIs
 - **OpenAI**: Content generation & DALL-E images
 - **Google AI**: Image analysis (Gemini Vision)
 - **Stability AI**: Alternative image generation
 - **Web Search**: Automatic research
-""")
 
-st.sidebar.markdown("### 💡 Tips")
-st.sidebar.markdown("""
+### 💡 Tips
 - Be specific with your topic
 - Upload relevant documents
 - Use high-quality images
 - Review generated content
 - At least OpenAI API key recommended
-""")
+"""
+
+st.sidebar.markdown(_SIDEBAR_INFO)
 
 if __name__ == "__main__":
     main()